@@ -1,10 +1,17 @@
 import streamlit as st
-from crewai import Task, Crew, Process
-from ai.agents import create_agents
+from utils.helpers import lazy_import
+
+# Bump when the task prompts below change so cached analyses are invalidated
+PROMPT_VERSION = 1
 
 def create_tasks(location, industry, specific_concerns):
     """Create AI-powered analysis and recommendations."""
     try:
+        # crewai is heavy to import, so it is only loaded once an analysis is requested
+        crewai = lazy_import("crewai")
+        Task, Crew, Process = crewai.Task, crewai.Crew, crewai.Process
+        create_agents = lazy_import("ai.agents").create_agents
+        
         # Create simple progress bar and status text
         progress_bar = st.progress(0)
         status_text = st.empty()
@@ -36,8 +43,6 @@ def create_tasks(location, industry, specific_concerns):
             task_name="Climate Analysis"
         )
         
-        progress_bar.progress(50)
-        
         impact_assessment = Task(
             description=f"""Evaluate how the current and forecasted weather conditions will 
             impact the {industry} sector in {location}. Consider:
@@ -79,14 +84,30 @@ def create_tasks(location, industry, specific_concerns):
             task_name="Recommendations"
         )
         
+        tasks = [climate_analysis, impact_assessment, recommendations]
+        
+        # Report progress as the crew works through the tasks instead of only at the end
+        completed = []
+        
+        def on_step(step_output):
+            current = tasks[min(len(completed), len(tasks) - 1)]
+            status_text.text(f"{current.task_name} in progress... (task {len(completed) + 1} of {len(tasks)})")
+        
+        def on_task_done(task_output):
+            completed.append(task_output)
+            progress_bar.progress(25 + 75 * len(completed) // len(tasks))
+            status_text.text(f"{tasks[len(completed) - 1].task_name} completed ({len(completed)}/{len(tasks)})")
+        
         # Create and run crew
         try:
             crew = Crew(
                 agents=[climate_analyst, impact_analyst, recommendation_specialist],
-                tasks=[climate_analysis, impact_assessment, recommendations],
+                tasks=tasks,
                 verbose=True,
                 process=Process.sequential,
-                max_retries=2
+                max_retries=2,
+                step_callback=on_step,
+                task_callback=on_task_done
             )
             
             # Run the analysis
@@ -96,7 +117,8 @@ def create_tasks(location, industry, specific_concerns):
             progress_bar.progress(100)
             status_text.text("Analysis completed!")
             
-            return result
+            # keep the plain text so utils.ai_cache can store the result
+            return str(result)
             
         except Exception as e:
             st.error(f"Error in AI Analysis: {str(e)}")
@@ -1,3 +1,4 @@
+from statistics import fmean
 from utils.helpers import extract_values
 
 def analyze_trend(data: dict, metric: str) -> dict:
@@ -20,7 +21,7 @@ def analyze_trend(data: dict, metric: str) -> dict:
             return {"error": "No valid data points found"}
             
         # calculate statistics
-        avg = sum(values) / len(values)
+        avg = fmean(values)
         trend = "increasing" if values[-1] > values[0] else "decreasing"
         change = ((values[-1] - values[0]) / values[0]) * 100 if values[0] != 0 else 0
         
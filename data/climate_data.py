@@ -1,33 +1,160 @@
+import asyncio
 import os
-import requests
+from calendar import monthrange
 from datetime import datetime
-from utils.helpers import handle_api_error
+from functools import lru_cache
+import diskcache
+import numpy as np
+import pandas as pd
+import streamlit as st
+from dateutil import tz
+from utils.http_client import http_get, async_client, async_http_get, async_stream_items, decode_json
+from utils.helpers import handle_api_error, ErrorResult
+from utils.constants import CACHE_DIR
+
+# Persistent cache shared across runs: coordinates never change, monthly
+# statistical aggregates change at most daily
+GEOCODE_CACHE_TTL = 30 * 86400
+MONTH_STATS_CACHE_TTL = 86400
+_DISK_CACHE = diskcache.Cache(CACHE_DIR)
+
+@lru_cache(maxsize=256)
+def _geocode(location, api_key):
+    """Look up coordinates for a location; raises instead of returning errors so failures are not cached"""
+    cache_key = f"#{location}"
+    coordinates = _DISK_CACHE.get(cache_key)
+    if coordinates is not None:
+        return coordinates
+    
+    geocode_url = f"https://api.openweathermap.org/geo/1.0/direct?q={location}&limit=1&appid={api_key}"
+    geo_response = http_get(geocode_url)
+    geo_data = decode_json(geo_response)
+    
+    if not geo_data:
+        raise LookupError(f"location {location} not found")
+    
+    coordinates = (geo_data[0]['lat'], geo_data[0]['lon'])
+    _DISK_CACHE.set(cache_key, coordinates, expire=GEOCODE_CACHE_TTL)
+    return coordinates
+
+def clear_disk_cache():
+    """Drop stored coordinates and monthly statistics, including the in-process geocode memo"""
+    _DISK_CACHE.clear()
+    _geocode.cache_clear()
 
 def get_location_coordinates(location, api_key):
     """Get coordinates for a location"""
     try:
-        geocode_url = f"http://api.openweathermap.org/geo/1.0/direct?q={location}&limit=1&appid={api_key}"
-        geo_response = requests.get(geocode_url)
-        geo_data = geo_response.json()
+        # normalise so the climate and impact paths share one geocode and one disk entry
+        return _geocode(location.strip().lower(), api_key), None
+    except LookupError as e:
+        return None, handle_api_error(str(e))
+    except Exception as e:
+        return None, handle_api_error("error getting location coordinates", e)
+
+def _unwrap(result):
+    """Re-raise an exception captured by asyncio.gather, otherwise return the result"""
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+async def _fetch_json(client, url):
+    """Fetch a url with the async client and decode the JSON response"""
+    response = await async_http_get(client, url)
+    return decode_json(response)
+
+async def _fetch_forecast_columns(client, url):
+    """Stream the forecast entries, keeping only the fields used for the hourly and daily forecast"""
+    columns = {'dt': [], 'main.temp': [], 'main.humidity': [], 'wind.speed': []}
+    async for item in async_stream_items(client, url, 'list.item'):
+        columns['dt'].append(item['dt'])
+        columns['main.temp'].append(item['main']['temp'])
+        columns['main.humidity'].append(item['main']['humidity'])
+        columns['wind.speed'].append(item['wind']['speed'])
+    return columns
+
+async def _get_month_stat(client, lat, lon, month_num, api_key):
+    """Get the statistical aggregation 'result' for a month, or None if unavailable"""
+    cache_key = f"{{{lat},{lon},{month_num}}}"
+    result = _DISK_CACHE.get(cache_key)
+    if result is not None:
+        return result
+    
+    # use the statistical monthly aggregation api
+    statistical_url = f"https://history.openweathermap.org/data/2.5/aggregated/month?lat={lat}&lon={lon}&month={month_num}&appid={api_key}"
+    statistical_data = await _fetch_json(client, statistical_url)
+    if 'result' not in statistical_data:
+        return None
+    
+    _DISK_CACHE.set(cache_key, statistical_data['result'], expire=MONTH_STATS_CACHE_TTL)
+    return statistical_data['result']
+
+async def _fetch_all_months(client, lat, lon, month_nums, api_key):
+    """Fetch statistics for all months concurrently, returning failures as exceptions"""
+    tasks = [_get_month_stat(client, lat, lon, month_num, api_key) for month_num in month_nums]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _fetch_climate_responses(lat, lon, month_nums, api_key):
+    """Fetch monthly statistics, current weather and forecast concurrently over shared HTTP/2 connections"""
+    current_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&units=metric&appid={api_key}"
+    forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&units=metric&appid={api_key}"
+    
+    async with async_client() as client:
+        return await asyncio.gather(
+            _fetch_all_months(client, lat, lon, month_nums, api_key),
+            _fetch_json(client, current_url),
+            _fetch_forecast_columns(client, forecast_url),
+            return_exceptions=True
+        )
+
+def _month_values(year, month_num, stat):
+    """Convert a month's statistics into (month name, temperature, precipitation, humidity, wind)"""
+    month_date = datetime(year, month_num, 1)
+    month_name = month_date.strftime('%b %Y')
+    
+    try:
+        result = _unwrap(stat)
         
-        if not geo_data:
-            return None, handle_api_error(f"location {location} not found")
+        if result is not None:
+            # get temperature data (convert from kelvin to celsius)
+            temp_mean = result['temp']['mean'] - 273.15
+            
+            # get precipitation data
+            precip_mean = result['precipitation']['mean']
+            # multiply by days in month to get monthly total (handles leap years)
+            days_in_month = monthrange(year, month_num)[1]
+            
+            # get humidity and wind data
+            humidity_mean = result['humidity']['mean']
+            wind_mean = result['wind']['mean']
+            
+            return month_name, temp_mean, precip_mean * days_in_month, humidity_mean, wind_mean
         
-        return (geo_data[0]['lat'], geo_data[0]['lon']), None
+        print(f"no statistical data available for {month_name}")
     except Exception as e:
-        return None, handle_api_error("error getting location coordinates", e)
+        print(f"error fetching statistical data for {month_name}: {str(e)}")
+    
+    return month_name, np.nan, np.nan, np.nan, np.nan
 
 def get_climate_data(location: str) -> dict:
     """Retrieve comprehensive climate data for a specific location using OpenWeatherMap statistical API."""
+    try:
+        return _get_climate_data(location)
+    except ErrorResult as e:
+        return e.error
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_climate_data(location):
+    """Cached body of get_climate_data; errors are raised as ErrorResult so they are retried on the next call"""
     api_key = os.getenv("OPENWEATHER_API_KEY")
     
     if not api_key:
-        return {"error": "Missing API keys. Make sure OPENWEATHER_API_KEY is set in the .env file"}
+        raise ErrorResult({"error": "Missing API keys. Make sure OPENWEATHER_API_KEY is set in the .env file"})
     
     # get coordinates for the location
     coordinates, error = get_location_coordinates(location, api_key)
     if coordinates is None:
-        return error
+        raise ErrorResult(error)
     
     lat, lon = coordinates
     
@@ -35,93 +162,36 @@ def get_climate_data(location: str) -> dict:
     current_date = datetime.now()
     current_month = current_date.month
     
-    # create monthly data points
-    months = []
-    temperature_trends = []
-    precipitation_trends = []
-    humidity_trends = []
-    wind_trends = []
-    
-    # fetch statistical monthly data for the past 12 months
+    # calculate (year, month number) going backwards from current month
+    month_specs = []
     for i in range(12):
-        # calculate month number (going backwards from current month)
         month_num = ((current_month - i - 1) % 12) + 1
-        
-        # format month name
-        month_date = datetime(current_date.year if month_num <= current_month else current_date.year - 1, month_num, 1)
-        month_name = month_date.strftime('%b %Y')
-        months.append(month_name)
-        
-        # use the statistical monthly aggregation api
-        statistical_url = f"https://history.openweathermap.org/data/2.5/aggregated/month?lat={lat}&lon={lon}&month={month_num}&appid={api_key}"
-        
-        try:
-            statistical_response = requests.get(statistical_url)
-            statistical_data = statistical_response.json()
-            
-            if 'result' in statistical_data:
-                # get temperature data (convert from kelvin to celsius)
-                temp_mean = statistical_data['result']['temp']['mean'] - 273.15
-                temperature_trends.append(temp_mean)
-                
-                # get precipitation data
-                precip_mean = statistical_data['result']['precipitation']['mean']
-                # multiply by days in month to get monthly total
-                days_in_month = 30  # approximate
-                if month_num in [1, 3, 5, 7, 8, 10, 12]:
-                    days_in_month = 31
-                elif month_num == 2:
-                    days_in_month = 28  # simplified, not accounting for leap years
-                precipitation_trends.append(precip_mean * days_in_month)
-                
-                # get humidity data
-                humidity_mean = statistical_data['result']['humidity']['mean']
-                humidity_trends.append(humidity_mean)
-                
-                # get wind data
-                wind_mean = statistical_data['result']['wind']['mean']
-                wind_trends.append(wind_mean)
-            else:
-                temperature_trends.append(None)
-                precipitation_trends.append(None)
-                humidity_trends.append(None)
-                wind_trends.append(None)
-                print(f"no statistical data available for {month_name}")
-        except Exception as e:
-            temperature_trends.append(None)
-            precipitation_trends.append(None)
-            humidity_trends.append(None)
-            wind_trends.append(None)
-            print(f"error fetching statistical data for {month_name}: {str(e)}")
-    
-    # reverse the lists to show oldest to newest
-    months.reverse()
-    temperature_trends.reverse()
-    precipitation_trends.reverse()
-    humidity_trends.reverse()
-    wind_trends.reverse()
+        year = current_date.year if month_num <= current_month else current_date.year - 1
+        month_specs.append((year, month_num))
     
-    # remove none values (missing data)
-    valid_months = []
-    valid_temps = []
-    valid_precip = []
-    valid_humidity = []
-    valid_wind = []
+    # all requests are network-bound, so issue them concurrently
+    month_nums = [month_num for _, month_num in month_specs]
+    monthly_stats, current_result, forecast_result = asyncio.run(
+        _fetch_climate_responses(lat, lon, month_nums, api_key))
+    monthly_results = [
+        _month_values(year, month_num, stat)
+        for (year, month_num), stat in zip(month_specs, monthly_stats)
+    ]
     
-    for i in range(len(months)):
-        if temperature_trends[i] is not None:
-            valid_months.append(months[i])
-            valid_temps.append(temperature_trends[i])
-            valid_precip.append(precipitation_trends[i] if precipitation_trends[i] is not None else 0)
-            valid_humidity.append(humidity_trends[i] if humidity_trends[i] is not None else 0)
-            valid_wind.append(wind_trends[i] if wind_trends[i] is not None else 0)
+    # stack the monthly values (oldest to newest) and drop months without data
+    months = np.array([result[0] for result in monthly_results])[::-1]
+    trends = np.array([result[1:] for result in monthly_results], dtype=np.float64).T[:, ::-1]
+    mask = ~np.isnan(trends[0])
+    valid_months = months[mask].tolist()
+    valid_temps, valid_precip, valid_humidity, valid_wind = (
+        np.nan_to_num(trend[mask]).tolist() for trend in trends)
     
     # if we don't have any valid data, try to get yearly statistical data instead
     if not valid_months:
         try:
             yearly_url = f"https://history.openweathermap.org/data/2.5/aggregated/year?lat={lat}&lon={lon}&appid={api_key}"
-            yearly_response = requests.get(yearly_url)
-            yearly_data = yearly_response.json()
+            yearly_response = http_get(yearly_url)
+            yearly_data = decode_json(yearly_response)
             
             if 'result' in yearly_data and yearly_data['result']:
                 # create monthly data from yearly statistics
@@ -136,20 +206,20 @@ def get_climate_data(location: str) -> dict:
                         valid_wind.append(month_data['wind']['mean'])
             
             if not valid_months:
-                return {"error": "could not retrieve statistical climate data"}
+                raise ErrorResult({"error": "could not retrieve statistical climate data"})
+        except ErrorResult:
+            raise
         except Exception as e:
-            return {"error": f"error fetching yearly statistical data: {str(e)}"}
+            raise ErrorResult({"error": f"error fetching yearly statistical data: {str(e)}"})
     
     # add additional statistical data if available
     additional_stats = {}
     try:
         # get current month's statistical data for detailed analysis
-        current_month_url = f"https://history.openweathermap.org/data/2.5/aggregated/month?lat={lat}&lon={lon}&month={current_month}&appid={api_key}"
-        current_month_response = requests.get(current_month_url)
-        current_month_data = current_month_response.json()
+        # (already fetched along with the other months)
+        result = _unwrap(dict(zip(month_nums, monthly_stats)).get(current_month))
         
-        if 'result' in current_month_data:
-            result = current_month_data['result']
+        if result is not None:
             additional_stats = {
                 "temperature": {
                     "record_min": round(result['temp']['record_min'] - 273.15, 1),  # convert to celsius
@@ -181,13 +251,11 @@ def get_climate_data(location: str) -> dict:
         print(f"error fetching additional statistical data: {str(e)}")
     
     # Get current weather data
-    current_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&units=metric&appid={api_key}"
     try:
-        current_response = requests.get(current_url)
-        current_data = current_response.json()
+        current_data = _unwrap(current_result)
         
         if 'main' not in current_data:
-            return {"error": "Could not retrieve current weather data"}
+            raise ErrorResult({"error": "Could not retrieve current weather data"})
             
         current_weather = {
             "current_temperature": current_data['main'].get('temp', 'N/A'),
@@ -196,28 +264,29 @@ def get_climate_data(location: str) -> dict:
             "current_pressure": current_data['main'].get('pressure', 'N/A'),
             "current_wind_speed": current_data.get('wind', {}).get('speed', 'N/A')
         }
+    except ErrorResult:
+        raise
     except Exception as e:
         current_weather = {}
         print(f"Error fetching current weather: {str(e)}")
 
     # Get 5 day forecast with 3-hour intervals
-    forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&units=metric&appid={api_key}"
     try:
-        forecast_response = requests.get(forecast_url)
-        forecast_data = forecast_response.json()
+        forecast_columns = _unwrap(forecast_result)
         
         hourly_temps = []
         hourly_humidity = []
         hourly_wind = []
         hourly_dates = []
         
-        if 'list' in forecast_data:
-            for item in forecast_data['list']:
-                date = datetime.fromtimestamp(item['dt'])
-                hourly_temps.append(item['main']['temp'])
-                hourly_humidity.append(item['main']['humidity'])
-                hourly_wind.append(item['wind']['speed'])
-                hourly_dates.append(date.strftime('%d/%m - %H:%M'))
+        if forecast_columns['dt']:
+            # the forecast entries were already projected to columns while streaming
+            forecast = pd.DataFrame(forecast_columns)
+            local_times = pd.to_datetime(forecast['dt'], unit='s', utc=True).dt.tz_convert(tz.tzlocal())
+            hourly_temps = forecast['main.temp'].tolist()
+            hourly_humidity = forecast['main.humidity'].tolist()
+            hourly_wind = forecast['wind.speed'].tolist()
+            hourly_dates = local_times.dt.strftime('%d/%m - %H:%M').tolist()
     except Exception as e:
         print(f"Error fetching forecast data: {str(e)}")
         hourly_temps, hourly_humidity, hourly_wind, hourly_dates = [], [], [], []
@@ -230,32 +299,19 @@ def get_climate_data(location: str) -> dict:
     daily_dates = []
     
     try:
-        if 'list' in forecast_data:
+        if hourly_dates:
             # Group forecast data by day
-            daily_data = {}
-            for item in forecast_data['list']:
-                date = datetime.fromtimestamp(item['dt'])
-                day_key = date.strftime('%Y-%m-%d')
-                
-                if day_key not in daily_data:
-                    daily_data[day_key] = {
-                        'temps': [],
-                        'humidity': [],
-                        'wind': []
-                    }
-                
-                daily_data[day_key]['temps'].append(item['main']['temp'])
-                daily_data[day_key]['humidity'].append(item['main']['humidity'])
-                daily_data[day_key]['wind'].append(item['wind']['speed'])
-            
-            # Calculate daily values
-            for day_key, data in daily_data.items():
-                if data['temps']:
-                    daily_temps_max.append(max(data['temps']))
-                    daily_temps_min.append(min(data['temps']))
-                    daily_humidity.append(sum(data['humidity']) / len(data['humidity']))
-                    daily_wind.append(sum(data['wind']) / len(data['wind']))
-                    daily_dates.append(day_key)
+            daily = forecast.groupby(local_times.dt.strftime('%Y-%m-%d'), sort=True).agg(
+                temps_max=('main.temp', 'max'),
+                temps_min=('main.temp', 'min'),
+                humidity=('main.humidity', 'mean'),
+                wind=('wind.speed', 'mean')
+            )
+            daily_temps_max = daily['temps_max'].tolist()
+            daily_temps_min = daily['temps_min'].tolist()
+            daily_humidity = daily['humidity'].tolist()
+            daily_wind = daily['wind'].tolist()
+            daily_dates = daily.index.tolist()
     except Exception as e:
         print(f"Error processing daily forecast: {str(e)}")
 
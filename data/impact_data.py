@@ -1,13 +1,137 @@
 import os
+import threading
 from datetime import datetime
-import requests
+from functools import lru_cache
+import numpy as np
+import streamlit as st
+from utils.http_client import http_get, decode_json
 from utils.constants import (VALID_SECTORS, TEMP_HIGH_THRESHOLD, TEMP_LOW_THRESHOLD, 
                            HUMIDITY_HIGH_THRESHOLD, HUMIDITY_LOW_THRESHOLD, WIND_HIGH_THRESHOLD, 
                            WIND_LOW_THRESHOLD, SEVERE_NEGATIVE_IMPACT, NEGATIVE_IMPACT, 
                            SLIGHT_NEGATIVE_IMPACT, NEUTRAL_IMPACT, POSITIVE_IMPACT)
-from utils.helpers import handle_api_error
+from utils.helpers import handle_api_error, ErrorResult
 from data.climate_data import get_location_coordinates
 
+# Sector-specific impact rules. Each weather metric multiplies its deviation from the
+# monthly average by "above" when the deviation exceeds "threshold" and by "below"
+# otherwise ("absolute" compares the size of the deviation instead). The matching
+# description is picked the same way.
+SECTOR_IMPACT_RULES = {
+    "Agriculture": {
+        "temperature": {
+            "threshold": 0, "above": -2.5, "below": -1.5,
+            "description": ("High temperature affecting crop growth and irrigation needs",
+                            "Low temperature affecting crop growth and irrigation needs")
+        },
+        "humidity": {
+            "threshold": 0, "above": -1.8, "below": -1.2,
+            "description": ("High humidity affecting plant diseases and irrigation",
+                            "Low humidity affecting plant diseases and irrigation")
+        },
+        "wind": {
+            "threshold": 5, "above": -1.5, "below": 0.8,
+            "description": ("Strong wind affecting pollination and evaporation",
+                            "Light wind affecting pollination and evaporation")
+        },
+        "conditions": {
+            "Clear": "optimal conditions for field operations",
+            "Clouds": "suitable conditions for most agricultural activities",
+            "Rain": "beneficial for crop growth but may limit field operations",
+            "Snow": "risk of frost damage to crops",
+            "Thunderstorm": "risk of crop damage and unsafe for field operations",
+            "Mist": "increased disease risk for sensitive crops",
+            "Fog": "limited visibility for agricultural operations"
+        }
+    },
+    "Energy": {
+        "temperature": {
+            "threshold": 10, "above": -1.0, "below": 0.5, "absolute": True,
+            "description": ("Temperature reducing energy efficiency",
+                            "Temperature optimizing energy efficiency")
+        },
+        "humidity": {
+            "threshold": 0, "above": -0.5, "below": -0.5,
+            "description": ("Humidity affecting cooling efficiency",
+                            "Humidity affecting cooling efficiency")
+        },
+        "wind": {
+            "threshold": 0, "above": 1.5, "below": -0.5,
+            "description": ("Increased wind energy production",
+                            "Reduced wind energy production")
+        },
+        "conditions": {
+            "Clear": "optimal for solar energy production",
+            "Clouds": "reduced solar energy generation",
+            "Rain": "reduced solar efficiency, normal wind operations",
+            "Snow": "potential system stress, reduced efficiency",
+            "Thunderstorm": "risk to infrastructure, emergency protocols needed",
+            "Mist": "reduced solar generation efficiency",
+            "Fog": "significant reduction in solar energy production"
+        }
+    }
+}
+
+# Display names for the impact scores, in the order of the impact_scores array
+IMPACT_TYPES = ("Temperature", "Humidity", "Wind")
+
+# Template for other sectors with basic weather impacts ({sector} is filled in per sector)
+DEFAULT_IMPACT_RULES = {
+    "temperature": {
+        "threshold": 0, "above": -1.0, "below": -1.0,
+        "description": ("Temperature affecting operational efficiency in {sector}",
+                        "Temperature affecting operational efficiency in {sector}")
+    },
+    "humidity": {
+        "threshold": 0, "above": -0.5, "below": -0.5,
+        "description": ("Humidity affecting working conditions in {sector}",
+                        "Humidity affecting working conditions in {sector}")
+    },
+    "wind": {
+        "threshold": 0, "above": -1.0, "below": -1.0,
+        "description": ("Wind conditions affecting {sector} operations",
+                        "Wind conditions affecting {sector} operations")
+    },
+    "conditions": {
+        "Clear": "optimal conditions for {sector} operations",
+        "Clouds": "normal operating conditions for {sector}",
+        "Rain": "some operational adjustments needed in {sector}",
+        "Snow": "significant impact on {sector} operations",
+        "Thunderstorm": "severe disruption to {sector} operations",
+        "Mist": "minor impacts on {sector} visibility",
+        "Fog": "reduced visibility affecting {sector} operations"
+    }
+}
+
+# Tracks whether the cached analysis actually ran during the current call
+_cache_state = threading.local()
+
+@lru_cache(maxsize=None)
+def _sector_rules(sector):
+    """Return the impact rules for a sector, filling in the default template if needed."""
+    if sector in SECTOR_IMPACT_RULES:
+        return SECTOR_IMPACT_RULES[sector]
+    
+    rules = {
+        metric: {**rule, "description": tuple(d.format(sector=sector) for d in rule["description"])}
+        for metric, rule in DEFAULT_IMPACT_RULES.items() if metric != "conditions"
+    }
+    rules["conditions"] = {
+        condition: text.format(sector=sector)
+        for condition, text in DEFAULT_IMPACT_RULES["conditions"].items()
+    }
+    return rules
+
+def _score_impact(rule, deviation):
+    """Apply an impact rule to a deviation and return (impact, description)."""
+    measured = abs(deviation) if rule.get("absolute") else deviation
+    above = measured > rule["threshold"]
+    impact = deviation * (rule["above"] if above else rule["below"])
+    return impact, rule["description"][0 if above else 1]
+
+def _normalize(x):
+    """Clip an impact value to the -10 to +10 scale."""
+    return -10.0 if x < -10.0 else (10.0 if x > 10.0 else x)
+
 def interpret_impact_score(score):
     """interpret the impact score on a scale from very negative to very positive."""
     if score < -7:
@@ -25,6 +149,27 @@ def interpret_impact_score(score):
 
 def get_weather_impact_analysis(location: str, sector: str) -> dict:
     """Analyze how weather patterns impact different sectors based on statistical weather data."""
+    _cache_state.miss = False
+    try:
+        result = _cached_weather_impact_analysis(location.strip().lower(), sector, datetime.now().hour)
+    except ErrorResult as e:
+        result = e.error
+    result["location"] = location
+    result["_cache"] = "MISS" if _cache_state.miss else "HIT"
+    return result
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_weather_impact_analysis(location_key, sector, current_hour):
+    """Run the impact analysis once per normalized location, sector and hour."""
+    _cache_state.miss = True
+    result = _analyze_weather_impact(location_key, sector)
+    # errors are raised so they are not cached and the next call retries
+    if "error" in result:
+        raise ErrorResult(result)
+    return result
+
+def _analyze_weather_impact(location, sector):
+    """Fetch current and statistical weather data and score the sector impact."""
     api_key = os.getenv("OPENWEATHER_API_KEY")
     
     if sector not in VALID_SECTORS:
@@ -41,8 +186,8 @@ def get_weather_impact_analysis(location: str, sector: str) -> dict:
     current_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&units=metric&appid={api_key}"
     
     try:
-        current_response = requests.get(current_url)
-        current_data = current_response.json()
+        current_response = http_get(current_url)
+        current_data = decode_json(current_response)
         
         if 'main' not in current_data or 'weather' not in current_data:
             return {"error": "could not retrieve current weather data"}
@@ -57,8 +202,8 @@ def get_weather_impact_analysis(location: str, sector: str) -> dict:
         current_month = datetime.now().month
         statistical_url = f"https://history.openweathermap.org/data/2.5/aggregated/month?lat={lat}&lon={lon}&month={current_month}&appid={api_key}"
         
-        statistical_response = requests.get(statistical_url)
-        statistical_data = statistical_response.json()
+        statistical_response = http_get(statistical_url)
+        statistical_data = decode_json(statistical_response)
         
         if 'result' not in statistical_data:
             return {"error": "could not retrieve statistical weather data for comparison"}
@@ -74,100 +219,25 @@ def get_weather_impact_analysis(location: str, sector: str) -> dict:
         wind_deviation = current_wind - avg_wind
         
         # sector-specific impact analysis
-        sector_impacts = {
-            "Agriculture": {
-                "temperature": {
-                    "impact": temp_deviation * (-2.5 if temp_deviation > 0 else -1.5),
-                    "description": f"{'High' if temp_deviation > 0 else 'Low'} temperature affecting crop growth and irrigation needs"
-                },
-                "humidity": {
-                    "impact": humidity_deviation * (-1.8 if humidity_deviation > 0 else -1.2),
-                    "description": f"{'High' if humidity_deviation > 0 else 'Low'} humidity affecting plant diseases and irrigation"
-                },
-                "wind": {
-                    "impact": wind_deviation * (-1.5 if wind_deviation > 5 else 0.8),
-                    "description": f"{'Strong' if wind_deviation > 5 else 'Light'} wind affecting pollination and evaporation"
-                },
-                "conditions": {
-                    "Clear": "optimal conditions for field operations",
-                    "Clouds": "suitable conditions for most agricultural activities",
-                    "Rain": "beneficial for crop growth but may limit field operations",
-                    "Snow": "risk of frost damage to crops",
-                    "Thunderstorm": "risk of crop damage and unsafe for field operations",
-                    "Mist": "increased disease risk for sensitive crops",
-                    "Fog": "limited visibility for agricultural operations"
-                }
-            },
-            "Energy": {
-                "temperature": {
-                    "impact": temp_deviation * (-1.0 if abs(temp_deviation) > 10 else 0.5),
-                    "description": f"Temperature {'reducing' if abs(temp_deviation) > 10 else 'optimizing'} energy efficiency"
-                },
-                "humidity": {
-                    "impact": humidity_deviation * (-0.5),
-                    "description": "Humidity affecting cooling efficiency"
-                },
-                "wind": {
-                    "impact": wind_deviation * (1.5 if wind_deviation > 0 else -0.5),
-                    "description": f"{'Increased' if wind_deviation > 0 else 'Reduced'} wind energy production"
-                },
-                "conditions": {
-                    "Clear": "optimal for solar energy production",
-                    "Clouds": "reduced solar energy generation",
-                    "Rain": "reduced solar efficiency, normal wind operations",
-                    "Snow": "potential system stress, reduced efficiency",
-                    "Thunderstorm": "risk to infrastructure, emergency protocols needed",
-                    "Mist": "reduced solar generation efficiency",
-                    "Fog": "significant reduction in solar energy production"
-                }
-            }
-        }
-        
-        # For other sectors, create a default template with basic weather impacts
-        if sector not in sector_impacts:
-            sector_impacts[sector] = {
-                "temperature": {
-                    "impact": temp_deviation * (-1.0),
-                    "description": f"Temperature affecting operational efficiency in {sector}"
-                },
-                "humidity": {
-                    "impact": humidity_deviation * (-0.5),
-                    "description": f"Humidity affecting working conditions in {sector}"
-                },
-                "wind": {
-                    "impact": wind_deviation * (-1.0),
-                    "description": f"Wind conditions affecting {sector} operations"
-                },
-                "conditions": {
-                    "Clear": f"optimal conditions for {sector} operations",
-                    "Clouds": f"normal operating conditions for {sector}",
-                    "Rain": f"some operational adjustments needed in {sector}",
-                    "Snow": f"significant impact on {sector} operations",
-                    "Thunderstorm": f"severe disruption to {sector} operations",
-                    "Mist": f"minor impacts on {sector} visibility",
-                    "Fog": f"reduced visibility affecting {sector} operations"
-                }
-            }
-        
-        # get sector-specific impact data
-        sector_impact = sector_impacts[sector]
-        
-        # calculate overall impact score (-10 to +10 scale)
-        temp_impact = sector_impact["temperature"]["impact"]
-        humidity_impact = sector_impact["humidity"]["impact"]
-        wind_impact = sector_impact["wind"]["impact"]
+        rules = _sector_rules(sector)
+        temp_impact, temp_description = _score_impact(rules["temperature"], temp_deviation)
+        humidity_impact, humidity_description = _score_impact(rules["humidity"], humidity_deviation)
+        wind_impact, wind_description = _score_impact(rules["wind"], wind_deviation)
         
         # normalize impacts to a -10 to +10 scale
-        normalize = lambda x: max(min(x, 10), -10)
-        temp_impact_normalized = normalize(temp_impact)
-        humidity_impact_normalized = normalize(humidity_impact)
-        wind_impact_normalized = normalize(wind_impact)
+        temp_impact_normalized = _normalize(temp_impact)
+        humidity_impact_normalized = _normalize(humidity_impact)
+        wind_impact_normalized = _normalize(wind_impact)
+        
+        impact_scores = np.array([round(temp_impact_normalized, 1),
+                                  round(humidity_impact_normalized, 1),
+                                  round(wind_impact_normalized, 1)])
         
         # calculate overall impact (weighted average)
         overall_impact = (temp_impact_normalized * 0.5 + humidity_impact_normalized * 0.3 + wind_impact_normalized * 0.2)
         
         # get condition-specific impact description
-        condition_impact = sector_impact["conditions"].get(current_condition, "No specific impact data for this weather condition")
+        condition_impact = rules["conditions"].get(current_condition, "No specific impact data for this weather condition")
         
         return {
             "sector": sector,
@@ -185,18 +255,21 @@ def get_weather_impact_analysis(location: str, sector: str) -> dict:
             },
             "impacts": {
                 "temperature": {
-                    "impact_score": round(temp_impact_normalized, 1),
-                    "description": sector_impact["temperature"]["description"]
+                    "impact_score": impact_scores[0].item(),
+                    "description": temp_description
                 },
                 "humidity": {
-                    "impact_score": round(humidity_impact_normalized, 1),
-                    "description": sector_impact["humidity"]["description"]
+                    "impact_score": impact_scores[1].item(),
+                    "description": humidity_description
                 },
                 "wind": {
-                    "impact_score": round(wind_impact_normalized, 1),
-                    "description": sector_impact["wind"]["description"]
+                    "impact_score": impact_scores[2].item(),
+                    "description": wind_description
                 }
             },
+            # the scores above as one array, for charts and vectorised checks
+            "impact_types": IMPACT_TYPES,
+            "impact_scores": impact_scores,
             "condition_impact": condition_impact,
             "overall_impact": {
                 "score": round(overall_impact, 1),
@@ -1,9 +1,10 @@
 import streamlit as st
 import os
 from dotenv import load_dotenv
-from data.climate_data import get_climate_data
+from data.climate_data import get_climate_data, clear_disk_cache
 from data.impact_data import get_weather_impact_analysis
-from ai.crew import create_tasks
+from utils.ai_cache import cached_create_tasks, clear as clear_ai_cache
+from utils.constants import VALID_SECTORS_ORDER
 from visualization.climate_viz import display_climate_data
 from visualization.impact_viz import display_impact_data, get_sector_recommendations, get_context_guidance
 
@@ -17,13 +18,20 @@ def main():
         layout="wide",
         initial_sidebar_state="expanded"
     )
+    
+    # cached results can go stale across day boundaries, so allow a manual reset
+    if st.sidebar.button("Clear cache"):
+        st.cache_data.clear()
+        clear_ai_cache()
+        clear_disk_cache()
+        st.sidebar.success("Cache cleared")
+    
     st.title("🌎 Climate & Sustainability Analysis Platform")
     st.write("Analyze climate trends and sustainability metrics for your location and industry.")
     
     # User inputs
     location = st.text_input("Enter location (city, country):", "Copenhagen, Denmark")
-    industry = st.selectbox("Select industry sector:", 
-                           ["Agriculture", "Energy", "Transportation", "Tourism", "Construction", "Retail"])
+    industry = st.selectbox("Select industry sector:", list(VALID_SECTORS_ORDER))
     concerns = st.text_area("Any specific environmental concerns?", 
                            "How will the anticipated weather changes impact our operations over the coming year?")
     
@@ -46,7 +54,7 @@ def main():
                 
                 # generate AI analysis
                 try:
-                    tasks = create_tasks(location, industry, concerns)
+                    tasks = cached_create_tasks(location, industry, concerns)
                     
                     if tasks is None:
                         # provide alternative quick recommendations when AI analysis fails
@@ -66,16 +74,6 @@ def main():
                         # display results when AI analysis is successful
                         st.markdown("### AI Analysis Results")
                         st.markdown(tasks)  # this displays the raw result
-                        
-                        # split results into sections for better readability
-                        if isinstance(tasks, str) and len(tasks) > 0:
-                            sections = tasks.split("**")
-                            if len(sections) > 1:
-                                for i in range(1, len(sections)):
-                                    section = sections[i]
-                                    if i < len(sections) - 1:
-                                        section = section + "**"  # restore the removed "**"
-                                    st.markdown(f"**{section}")
                 except Exception as e:
                     st.error(f"Error in AI analysis: {str(e)}")
             except Exception as e:
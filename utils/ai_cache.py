@@ -0,0 +1,28 @@
+import hashlib
+import os
+import diskcache
+from ai.crew import create_tasks, PROMPT_VERSION
+from utils.constants import CACHE_DIR
+
+# Persistent cache for AI analyses, keyed on the full prompt context
+AI_CACHE_TTL = 7 * 86400
+_AI_CACHE = diskcache.Cache(os.path.join(CACHE_DIR, "ai"))
+_MISSING = object()
+
+def cached_create_tasks(location, industry, concerns):
+    """Return a stored AI analysis for the same inputs, or run the crew and store it"""
+    key = hashlib.sha256(f"{PROMPT_VERSION}|{location}|{industry}|{concerns}".encode()).hexdigest()
+    # a single lookup, since the entry can expire between a membership test and a read
+    result = _AI_CACHE.get(key, default=_MISSING)
+    if result is not _MISSING:
+        return result
+    
+    result = create_tasks(location, industry, concerns)
+    # failed analyses are not stored so they are retried next time
+    if result is not None:
+        _AI_CACHE.set(key, result, expire=AI_CACHE_TTL)
+    return result
+
+def clear():
+    """Drop all stored AI analyses"""
+    _AI_CACHE.clear()
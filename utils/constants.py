@@ -1,4 +1,5 @@
 # Collection of all constants
+import os
 
 # Threshold values for temperature evaluation
 TEMP_HIGH_THRESHOLD = 2
@@ -15,5 +16,9 @@ SLIGHT_NEGATIVE_IMPACT = 0
 NEUTRAL_IMPACT = 3
 POSITIVE_IMPACT = 7
 
-# Valid sectors for analysis
-VALID_SECTORS = ["Agriculture", "Energy", "Transportation", "Tourism", "Construction", "Retail"]
+# Valid sectors for analysis (ordered for display, frozenset for membership checks)
+VALID_SECTORS_ORDER = ("Agriculture", "Energy", "Transportation", "Tourism", "Construction", "Retail")
+VALID_SECTORS = frozenset(VALID_SECTORS_ORDER)
+
+# Directory for persistent on-disk caches
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "climate_app")
@@ -1,3 +1,17 @@
+import importlib
+from statistics import fmean
+
+# Modules loaded through lazy_import, shared across Streamlit reruns
+_MODULE_CACHE = {}
+
+def lazy_import(module_name):
+    """Import a module on first use and reuse it on later calls"""
+    module = _MODULE_CACHE.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+        _MODULE_CACHE[module_name] = module
+    return module
+
 def handle_api_error(error_msg, exception=None):
     """Centraliseret fejlhåndtering for API-kald"""
     if exception:
@@ -6,6 +20,12 @@ def handle_api_error(error_msg, exception=None):
         error_details = ""
     return {"error": f"{error_msg}{error_details}"}
     
+class ErrorResult(Exception):
+    """Carries an error dict out of a cached function, so the error itself is not cached"""
+    def __init__(self, error):
+        super().__init__(error["error"])
+        self.error = error
+
 def extract_values(data, metric):
     """Helper to extract values from different data structures"""
     if not isinstance(data, dict):
@@ -16,7 +36,7 @@ def extract_values(data, metric):
         for key, val in data["data"].items():
             if isinstance(val, list) and val:
                 results[key] = {
-                    "average": round(sum(val) / len(val), 2),
+                    "average": round(fmean(val), 2),
                     "trend": "increasing" if val[-1] > val[0] else "decreasing", 
                     "change_percent": round(((val[-1] - val[0]) / val[0]) * 100, 2) if val[0] != 0 else 0
                 }
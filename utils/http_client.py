@@ -0,0 +1,68 @@
+import asyncio
+import time
+import httpx
+import ijson
+import orjson
+
+# Retry policy for transient failures: connection errors are retried by the
+# transport, these status codes are retried with exponential backoff
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Shared HTTP/2 client for the OpenWeatherMap APIs. Keeping one client alive lets
+# back-to-back calls to api.* and history.* reuse their connections.
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+HTTP_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=MAX_RETRIES),
+    timeout=10.0
+)
+
+def async_client():
+    """Create an async HTTP/2 client with the same settings as HTTP_CLIENT"""
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=MAX_RETRIES),
+        timeout=10.0
+    )
+
+def _backoff(attempt):
+    """Seconds to wait before retry number attempt + 1"""
+    return BACKOFF_FACTOR * (2 ** attempt)
+
+def http_get(url):
+    """GET a url with the shared client, retrying rate limits and server errors"""
+    for attempt in range(MAX_RETRIES + 1):
+        response = HTTP_CLIENT.get(url)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        time.sleep(_backoff(attempt))
+
+async def async_http_get(client, url):
+    """GET a url with an async client, retrying rate limits and server errors"""
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.get(url)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        await asyncio.sleep(_backoff(attempt))
+
+async def async_stream_items(client, url, prefix):
+    """Stream a JSON response with an async client, yielding the items under prefix as they are parsed"""
+    for attempt in range(MAX_RETRIES + 1):
+        async with client.stream("GET", url) as response:
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                events = ijson.sendable_list()
+                parser = ijson.items_coro(events, prefix, use_float=True)
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in events:
+                        yield item
+                    del events[:]
+                parser.close()
+                for item in events:
+                    yield item
+                return
+        await asyncio.sleep(_backoff(attempt))
+
+def decode_json(response):
+    """Decode a JSON response body with orjson"""
+    return orjson.loads(response.content)
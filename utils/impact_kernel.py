@@ -0,0 +1,76 @@
+# Threshold classification of weather deviations and impact scores, compiled
+# with numba when it is installed so many locations can be scored at once
+import numpy as np
+from utils.constants import (TEMP_HIGH_THRESHOLD, TEMP_LOW_THRESHOLD,
+                            HUMIDITY_HIGH_THRESHOLD, HUMIDITY_LOW_THRESHOLD,
+                            WIND_HIGH_THRESHOLD, WIND_LOW_THRESHOLD,
+                            SEVERE_NEGATIVE_IMPACT, NEGATIVE_IMPACT,
+                            POSITIVE_IMPACT)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Columns of the codes returned by classify. The deviation columns hold 1 above
+# the high threshold, -1 below the low threshold and 0 otherwise.
+TEMP, HUMIDITY, WIND, GUIDANCE = range(4)
+
+# Values of the GUIDANCE column, in the order the score thresholds are checked
+CRITICAL, SUBOPTIMAL, OPTIMAL, NORMAL = range(4)
+
+# Advice keys for (above, below) each threshold, indexed by deviation column
+ADVICE_KEYS = (
+    ("high_temp", "low_temp"),
+    ("high_humidity", "low_humidity"),
+    ("high_wind", "low_wind")
+)
+
+def _classify_loop(temp_dev, humid_dev, wind_dev, score):
+    """Classify each row with scalar comparisons (compiled by numba)"""
+    n = temp_dev.size
+    codes = np.empty((n, 4), dtype=np.int8)
+    for i in prange(n):
+        codes[i, 0] = 1 if temp_dev[i] > TEMP_HIGH_THRESHOLD else (-1 if temp_dev[i] < TEMP_LOW_THRESHOLD else 0)
+        codes[i, 1] = 1 if humid_dev[i] > HUMIDITY_HIGH_THRESHOLD else (-1 if humid_dev[i] < HUMIDITY_LOW_THRESHOLD else 0)
+        codes[i, 2] = 1 if wind_dev[i] > WIND_HIGH_THRESHOLD else (-1 if wind_dev[i] < WIND_LOW_THRESHOLD else 0)
+        if score[i] < SEVERE_NEGATIVE_IMPACT:
+            codes[i, 3] = CRITICAL
+        elif score[i] < NEGATIVE_IMPACT:
+            codes[i, 3] = SUBOPTIMAL
+        elif score[i] > POSITIVE_IMPACT:
+            codes[i, 3] = OPTIMAL
+        else:
+            codes[i, 3] = NORMAL
+    return codes
+
+def _deviation_codes(dev, high, low):
+    """1 above high, -1 below low, 0 in between"""
+    return np.where(dev > high, 1, np.where(dev < low, -1, 0))
+
+def _classify_numpy(temp_dev, humid_dev, wind_dev, score):
+    """Classify all rows with vectorised numpy comparisons"""
+    codes = np.empty((temp_dev.size, 4), dtype=np.int8)
+    codes[:, TEMP] = _deviation_codes(temp_dev, TEMP_HIGH_THRESHOLD, TEMP_LOW_THRESHOLD)
+    codes[:, HUMIDITY] = _deviation_codes(humid_dev, HUMIDITY_HIGH_THRESHOLD, HUMIDITY_LOW_THRESHOLD)
+    codes[:, WIND] = _deviation_codes(wind_dev, WIND_HIGH_THRESHOLD, WIND_LOW_THRESHOLD)
+    codes[:, GUIDANCE] = np.select(
+        [score < SEVERE_NEGATIVE_IMPACT, score < NEGATIVE_IMPACT, score > POSITIVE_IMPACT],
+        [CRITICAL, SUBOPTIMAL, OPTIMAL],
+        default=NORMAL
+    )
+    return codes
+
+# numba is optional; without it the numpy version gives the same codes
+_classify = njit(cache=True, parallel=True)(_classify_loop) if njit else _classify_numpy
+
+def classify(temp_dev, humid_dev, wind_dev, score=0.0):
+    """Return an int8 array of (temperature, humidity, wind, guidance) codes per row"""
+    arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(values, dtype=np.float64))
+                                   for values in (temp_dev, humid_dev, wind_dev, score)))
+    return _classify(*(np.ascontiguousarray(values) for values in arrays))
+
+def advice_keys(codes):
+    """Map one row of classify codes to the advice keys that apply"""
+    return [ADVICE_KEYS[column][0 if codes[column] > 0 else 1]
+            for column in (TEMP, HUMIDITY, WIND) if codes[column]]
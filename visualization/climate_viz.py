@@ -1,45 +1,230 @@
+import io
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
+import numpy as np
+from utils.helpers import lazy_import
 
-def display_climate_data(climate_data, location):
-    """Display climate data visualizations."""
-    if "error" in climate_data:
-        st.error(f"Climate data: {climate_data['error']}")
+# Data label placement for the monthly panels, in 2x2 grid order: (offset, format)
+MONTHLY_LABELS = (
+    (0.5, '{:.1f}°C'),
+    (0.5, '{:.1f}mm'),
+    (2, '{:.0f}%'),
+    (0.2, '{:.1f}m/s'),
+)
+
+# Font sizes applied to all climate charts
+PLOT_RC = {
+    'font.size': 14,
+    'axes.labelsize': 16,
+    'axes.titlesize': 18,
+    'xtick.labelsize': 12,
+    'ytick.labelsize': 12,
+    'legend.fontsize': 14,
+    'figure.titlesize': 20
+}
+
+# Figure sizes (inches) and the resolution charts are rasterised at. Streamlit
+# scales the images to the column width, so 100 dpi is plenty for display.
+_FIG_SIZE = (12, 7)
+_SMALL_FIG_SIZE = (8, 5)
+_MONTHLY_FIG_SIZE = (20, 12)
+_FIG_DPI = 100
+
+# Number of time labels on the hourly forecast x-axes
+HOURLY_TICKS = 7
+
+_STYLE_INITIALIZED = False
+
+def _init_style():
+    """Apply the seaborn style and font sizes once per process instead of on every rerun."""
+    global _STYLE_INITIALIZED
+    if _STYLE_INITIALIZED:
+        return
+    # Set seaborn style for nicer plots
+    lazy_import("seaborn").set_style("whitegrid")
+    lazy_import("matplotlib.pyplot").rcParams.update(PLOT_RC)
+    _STYLE_INITIALIZED = True
+
+def _annotate_extremes(ax, values, offset, fmt):
+    """Label only the lowest and highest point of a series, replacing earlier labels."""
+    for text in list(ax.texts):
+        text.remove()
+    if len(values) == 0:
         return
+    extremes = {int(np.argmin(values)), int(np.argmax(values))}
+    if ax.containers:
+        # bar charts get all their labels placed in one bar_label call
+        labels = [fmt.format(value) if i in extremes else '' for i, value in enumerate(values)]
+        ax.bar_label(ax.containers[0], labels=labels, padding=3, fontsize=12)
+        return
+    for i in extremes:
+        ax.annotate(fmt.format(values[i]), (i, values[i] + offset), ha='center', va='bottom', fontsize=12)
+
+def _build_monthly_figure(months, series):
+    """Draw the four monthly trend plots into a single shared 2x2 figure."""
+    plt = lazy_import("matplotlib.pyplot")
+    temp_data, precip_data, humidity_data, wind_data = series
+    xs = np.arange(len(months))
     
-    # Prepare data for visualization
-    months = climate_data["months"]
-    temp_data = climate_data["temperature_trends"]
-    precip_data = climate_data["precipitation_trends"]
-    humidity_data = climate_data["humidity_trends"]
-    wind_data = climate_data["wind_trends"]
+    fig, axes = plt.subplots(2, 2, figsize=_MONTHLY_FIG_SIZE)
+    (ax_temp, ax_precip), (ax_humidity, ax_wind) = axes
+    # one point per month, so plot directly instead of going through seaborn's aggregation
+    ax_temp.plot(xs, temp_data, marker='o', linewidth=3, color='#1f77b4')
+    ax_precip.bar(xs, precip_data, color='#2ca02c')
+    ax_humidity.plot(xs, humidity_data, marker='s', linewidth=3, color='#9467bd')
+    ax_wind.plot(xs, wind_data, marker='d', linewidth=3, color='#d62728')
     
-    # Set seaborn style for nicer plots
-    sns.set_style("whitegrid")
-    plt.rcParams.update({
-        'font.size': 14,
-        'axes.labelsize': 16,
-        'axes.titlesize': 18,
-        'xtick.labelsize': 12,
-        'ytick.labelsize': 12,
-        'legend.fontsize': 14,
-        'figure.titlesize': 20
-    })
+    titles = (
+        ('Temperature (°C)', 'Temperature Trends'),
+        ('Precipitation (mm/month)', 'Precipitation Trends'),
+        ('Humidity (%)', 'Humidity Trends'),
+        ('Wind Speed (m/s)', 'Wind Speed Trends'),
+    )
+    for ax, values, (ylabel, title), (offset, fmt) in zip(axes.flat, series, titles, MONTHLY_LABELS):
+        ax.set_xticks(xs)
+        ax.set_xticklabels(months, rotation=45, ha='right')
+        ax.set_xlabel('Month', fontsize=16, labelpad=10)
+        ax.set_ylabel(ylabel, fontsize=16, labelpad=10)
+        ax.set_title(title, fontsize=18, pad=20)
+        _annotate_extremes(ax, values, offset, fmt)
+    fig.tight_layout()
     
-    # Visualizations
-    st.header(f"Climate Trends for {location}")
-    st.subheader("Statistical Data Analysis")
+    # the figure is kept in session_state for reuse, so take it out of pyplot's
+    # registry instead of leaving it open after every new build
+    plt.close(fig)
+    return fig
+
+def _update_monthly_figure(fig, series):
+    """Swap new values into an existing monthly figure instead of rebuilding it."""
+    for ax, values, (offset, fmt) in zip(fig.axes, series, MONTHLY_LABELS):
+        if ax.containers:
+            for bar, height in zip(ax.containers[0], values):
+                bar.set_height(height)
+        else:
+            ax.lines[0].set_ydata(values)
+        _annotate_extremes(ax, values, offset, fmt)
+        ax.relim()
+        ax.autoscale_view()
+    fig.canvas.draw_idle()
+
+def _render_png(fig):
+    """Render a figure to PNG bytes at _FIG_DPI, leaving it open."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=_FIG_DPI)
+    return buf.getvalue()
+
+def _figure_png(fig):
+    """Render a figure to PNG bytes at _FIG_DPI and release it."""
+    png = _render_png(fig)
+    lazy_import("matplotlib.pyplot").close(fig)
+    return png
+
+def _hourly_ticks(hourly_dates):
+    """Tick positions and labels shared by both hourly forecast plots."""
+    n_dates = len(hourly_dates)
+    # evenly spaced from the first to the last entry, however many entries there are
+    tick_idx = np.linspace(0, n_dates - 1, min(HOURLY_TICKS, n_dates), dtype=int)
+    return tick_idx, np.asarray(hourly_dates)[tick_idx]
+
+@st.cache_data(show_spinner=False)
+def _build_hourly_temp_png(hourly_dates, hourly_temperatures):
+    """Draw the detailed 3-hourly temperature forecast."""
+    plt = lazy_import("matplotlib.pyplot")
+    pe = lazy_import("matplotlib.patheffects")
+    tick_idx, tick_labels = _hourly_ticks(hourly_dates)
     
-    # Display additional statistical data if available
-    if "statistics" in climate_data and climate_data["statistics"]:
-        stats = climate_data["statistics"]
-        
-        with st.expander("📊 Detailed Statistical Data (Current Month)", expanded=True):
-            sunshine_hours = f"### ☀️ Sunshine Hours\n* **{stats['sunshine_hours']} hours/month**" if 'sunshine_hours' in stats else ""
-            
-            st.markdown(f"""
+    fig, ax = plt.subplots(figsize=_FIG_SIZE)
+    temps = np.asarray(hourly_temperatures)
+    ax.plot(hourly_dates, temps, 
+            label='Temperature (°C)', color='red', alpha=0.6, linewidth=2,
+            path_effects=[pe.Stroke(linewidth=4, foreground='white'), pe.Normal()])
+    ax.fill_between(hourly_dates, temps - 1, temps + 1, 
+                    color='red', alpha=0.2)
+    ax.set_xlabel('Time', fontsize=16, labelpad=10)
+    ax.set_ylabel('Temperature (°C)', fontsize=16, labelpad=10)
+    ax.set_title('Detailed Temperature Forecast', fontsize=18, pad=20)
+    
+    # Optimize x-axis labels for better readability
+    ax.set_xticks(tick_idx)
+    ax.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=12)
+    ax.tick_params(axis='y', labelsize=12)
+    
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=14, loc='upper right')
+    fig.tight_layout()
+    return _figure_png(fig)
+
+@st.cache_data(show_spinner=False)
+def _build_daily_range_png(daily_dates, daily_temps_min, daily_temps_max):
+    """Draw the daily min/max temperature range forecast."""
+    plt = lazy_import("matplotlib.pyplot")
+    
+    fig, ax = plt.subplots(figsize=_FIG_SIZE)
+    # daily dates are 'YYYY-MM-DD' strings, so reorder the slices instead of parsing them
+    dates_display = [f"{d[8:10]}/{d[5:7]}" if isinstance(d, str) and len(d) == 10 else str(d)
+                     for d in daily_dates]
+    
+    ax.fill_between(dates_display, 
+                    daily_temps_min,
+                    daily_temps_max,
+                    alpha=0.3, color='red', label='Temperature Range')
+    ax.plot(dates_display, daily_temps_max, 
+            'r--', label='Max Temperature', linewidth=2)
+    ax.plot(dates_display, daily_temps_min, 
+            'b--', label='Min Temperature', linewidth=2)
+    ax.set_xlabel('Date', fontsize=16, labelpad=10)
+    ax.set_ylabel('Temperature (°C)', fontsize=16, labelpad=10)
+    ax.set_title('Daily Temperature Range', fontsize=18, pad=20)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=12)
+    ax.tick_params(axis='y', labelsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=14, loc='upper right')
+    fig.tight_layout()
+    return _figure_png(fig)
+
+@st.cache_data(show_spinner=False)
+def _build_humidity_wind_png(hourly_dates, hourly_humidity, hourly_wind):
+    """Draw hourly humidity and wind speed on twin y-axes."""
+    plt = lazy_import("matplotlib.pyplot")
+    tick_idx, tick_labels = _hourly_ticks(hourly_dates)
+    
+    # Humidity and wind correlation
+    fig, ax1 = plt.subplots(figsize=_SMALL_FIG_SIZE)
+    
+    # Plot humidity
+    ax1.set_xlabel('Time', fontsize=12, labelpad=8)
+    ax1.set_ylabel('Humidity (%)', fontsize=12, labelpad=8, color='blue')
+    humidity_line = ax1.plot(hourly_dates, hourly_humidity, 
+                             color='blue', label='Humidity', linewidth=2)
+    ax1.tick_params(axis='y', labelcolor='blue', labelsize=10)
+    
+    # Plot wind speed on secondary y-axis
+    ax2 = ax1.twinx()
+    ax2.set_ylabel('Wind Speed (m/s)', fontsize=12, labelpad=8, color='green')
+    wind_line = ax2.plot(hourly_dates, hourly_wind, 
+                         color='green', label='Wind Speed', linewidth=2)
+    ax2.tick_params(axis='y', labelcolor='green', labelsize=10)
+    
+    # Set x-axis ticks med mere plads og mindre tekst
+    ax1.set_xticks(tick_idx)
+    ax1.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=9)
+    
+    # Add title
+    ax1.set_title('Humidity and Wind Speed Correlation', fontsize=14, pad=15)
+    
+    # Add legend
+    lines = humidity_line + wind_line
+    labels = ['Humidity', 'Wind Speed']
+    ax1.legend(lines, labels, loc='upper right', fontsize=10)
+    
+    fig.tight_layout()
+    return _figure_png(fig)
+
+@st.cache_data(show_spinner=False)
+def _build_stats_md(location, stats):
+    """Format the current month's statistics as markdown, reused while they are unchanged."""
+    sunshine_hours = f"### ☀️ Sunshine Hours\n* **{stats['sunshine_hours']} hours/month**" if 'sunshine_hours' in stats else ""
+    
+    return f"""
 # Statistical Climate Data for {location}
 
 ### 🌡️ Temperature Records
@@ -63,196 +248,54 @@ def display_climate_data(climate_data, location):
 {sunshine_hours}
 
 *Note: This statistical data is calculated based on historical measurements.*
-""")
-    
-    # Monthly Trends Section
-    st.subheader("Monthly Climate Trends")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Temperature plot
-        fig, ax = plt.subplots(figsize=(12, 7))
-        sns.lineplot(x=range(len(months)), y=temp_data, marker='o', linewidth=3, color='#1f77b4', ax=ax)
-        ax.set_xticks(range(len(months)))
-        ax.set_xticklabels(months, rotation=45, ha='right')
-        ax.set_xlabel('Month', fontsize=16, labelpad=10)
-        ax.set_ylabel('Temperature (°C)', fontsize=16, labelpad=10)
-        ax.set_title('Temperature Trends', fontsize=18, pad=20)
-        plt.tight_layout()
-        for i, (x, y) in enumerate(zip(range(len(months)), temp_data)):
-            ax.text(x, y + 0.5, f'{y:.1f}°C', ha='center', va='bottom', fontsize=12)
-        st.pyplot(fig)
-    
-    with col2:
-        # Precipitation plot
-        fig, ax = plt.subplots(figsize=(12, 7))
-        bars = sns.barplot(x=range(len(months)), y=precip_data, color='#2ca02c', ax=ax)
-        ax.set_xticks(range(len(months)))
-        ax.set_xticklabels(months, rotation=45, ha='right')
-        ax.set_xlabel('Month', fontsize=16, labelpad=10)
-        ax.set_ylabel('Precipitation (mm/month)', fontsize=16, labelpad=10)
-        ax.set_title('Precipitation Trends', fontsize=18, pad=20)
-        plt.tight_layout()
-        for i, (x, y) in enumerate(zip(range(len(months)), precip_data)):
-            ax.text(x, y + 0.5, f'{y:.1f}mm', ha='center', va='bottom', fontsize=12)
-        st.pyplot(fig)
+"""
 
-    # Humidity and Wind Section
-    st.subheader("Humidity and Wind Patterns")
-    col1, col2 = st.columns(2)
+def _display_forecasts(climate_data):
+    """Show the forecast charts and statistics."""
+    # Look the forecast series up once
+    hourly_dates = climate_data.get("hourly_dates")
+    hourly_temps = climate_data.get("hourly_temperatures")
+    hourly_humidity = climate_data.get("hourly_humidity")
+    hourly_wind = climate_data.get("hourly_wind")
+    daily_dates = climate_data.get("daily_dates")
+    daily_temps_max = climate_data.get("daily_temps_max")
     
-    with col1:
-        # Humidity plot
-        fig, ax = plt.subplots(figsize=(12, 7))
-        sns.lineplot(x=range(len(months)), y=humidity_data, marker='s', linewidth=3, color='#9467bd', ax=ax)
-        ax.set_xticks(range(len(months)))
-        ax.set_xticklabels(months, rotation=45, ha='right')
-        ax.set_xlabel('Month', fontsize=16, labelpad=10)
-        ax.set_ylabel('Humidity (%)', fontsize=16, labelpad=10)
-        ax.set_title('Humidity Trends', fontsize=18, pad=20)
-        plt.tight_layout()
-        for i, (x, y) in enumerate(zip(range(len(months)), humidity_data)):
-            ax.text(x, y + 2, f'{y:.0f}%', ha='center', va='bottom', fontsize=12)
-        st.pyplot(fig)
-    
-    with col2:
-        # Wind plot
-        fig, ax = plt.subplots(figsize=(12, 7))
-        sns.lineplot(x=range(len(months)), y=wind_data, marker='d', linewidth=3, color='#d62728', ax=ax)
-        ax.set_xticks(range(len(months)))
-        ax.set_xticklabels(months, rotation=45, ha='right')
-        ax.set_xlabel('Month', fontsize=16, labelpad=10)
-        ax.set_ylabel('Wind Speed (m/s)', fontsize=16, labelpad=10)
-        ax.set_title('Wind Speed Trends', fontsize=18, pad=20)
-        plt.tight_layout()
-        for i, (x, y) in enumerate(zip(range(len(months)), wind_data)):
-            ax.text(x, y + 0.2, f'{y:.1f}m/s', ha='center', va='bottom', fontsize=12)
-        st.pyplot(fig)
-
-    # Detailed Forecasts Section
-    st.subheader("Detailed Weather Forecasts")
+    # the hourly and daily charts share one row, so create its columns before either branch
+    col1, col2 = st.columns(2)
     
     # Check if hourly data exists before visualization
-    if climate_data.get("hourly_temperatures") and climate_data.get("hourly_dates"):
-        col1, col2 = st.columns(2)
+    if hourly_temps and hourly_dates:
         with col1:
             with st.expander("🌡️ Detailed Temperature Forecast (3-Hour Intervals)", expanded=True):
-                # Detailed temperature trend (3-hourly)
-                fig, ax = plt.subplots(figsize=(12, 7))
-                ax.plot(climate_data["hourly_dates"], climate_data["hourly_temperatures"], 
-                        marker='o', label='Temperature (°C)', color='red', alpha=0.6, markersize=4)
-                ax.fill_between(climate_data["hourly_dates"], 
-                                [t-1 for t in climate_data["hourly_temperatures"]], 
-                                [t+1 for t in climate_data["hourly_temperatures"]], 
-                                color='red', alpha=0.2)
-                ax.set_xlabel('Time', fontsize=16, labelpad=10)
-                ax.set_ylabel('Temperature (°C)', fontsize=16, labelpad=10)
-                ax.set_title('Detailed Temperature Forecast', fontsize=18, pad=20)
-                
-                # Optimize x-axis labels for better readability
-                num_ticks = min(6, len(climate_data["hourly_dates"]))
-                step = len(climate_data["hourly_dates"]) // num_ticks
-                plt.xticks(range(0, len(climate_data["hourly_dates"]), step), 
-                          [climate_data["hourly_dates"][i] for i in range(0, len(climate_data["hourly_dates"]), step)],
-                          rotation=45, ha='right', fontsize=12)
-                plt.yticks(fontsize=12)
-                
-                ax.grid(True, alpha=0.3)
-                ax.legend(fontsize=14, loc='upper right')
-                plt.tight_layout()
-                st.pyplot(fig)
+                st.image(_build_hourly_temp_png(hourly_dates, hourly_temps),
+                         width="stretch")
 
     # Check if daily data exists before visualization
-    if climate_data.get("daily_temps_max") and climate_data.get("daily_dates"):
+    if daily_temps_max and daily_dates:
         with col2:
             with st.expander("📅 Daily Temperature Range Forecast", expanded=True):
-                # Daily temperature range visualization
-                fig, ax = plt.subplots(figsize=(12, 7))
-                dates_display = []
-                for d in climate_data["daily_dates"]:
-                    try:
-                        date_obj = datetime.strptime(d, '%Y-%m-%d')
-                        dates_display.append(date_obj.strftime('%d/%m'))
-                    except (ValueError, TypeError):
-                        dates_display.append(d)
-                
-                ax.fill_between(dates_display, 
-                                climate_data["daily_temps_min"],
-                                climate_data["daily_temps_max"],
-                                alpha=0.3, color='red', label='Temperature Range')
-                ax.plot(dates_display, climate_data["daily_temps_max"], 
-                        'r--', label='Max Temperature', linewidth=2)
-                ax.plot(dates_display, climate_data["daily_temps_min"], 
-                        'b--', label='Min Temperature', linewidth=2)
-                ax.set_xlabel('Date', fontsize=16, labelpad=10)
-                ax.set_ylabel('Temperature (°C)', fontsize=16, labelpad=10)
-                ax.set_title('Daily Temperature Range', fontsize=18, pad=20)
-                plt.xticks(rotation=45, ha='right', fontsize=12)
-                plt.yticks(fontsize=12)
-                ax.grid(True, alpha=0.3)
-                ax.legend(fontsize=14, loc='upper right')
-                plt.tight_layout()
-                st.pyplot(fig)
+                st.image(_build_daily_range_png(daily_dates, climate_data["daily_temps_min"], daily_temps_max),
+                         width="stretch")
 
     # Check if hourly humidity and wind data exists
-    if (climate_data.get("hourly_humidity") and climate_data.get("hourly_wind") and 
-        climate_data.get("hourly_dates")):
+    if hourly_humidity and hourly_wind and hourly_dates:
         col1, col2 = st.columns([3, 2])
         
         # Først viser vi visualiseringen i venstre kolonne
         with col1:
             with st.expander("🌪️ Humidity and Wind Speed Correlation", expanded=True):
-                # Humidity and wind correlation
-                fig, ax1 = plt.subplots(figsize=(8, 5))
-                
-                # Format x-axis for better readability
-                num_ticks = min(5, len(climate_data["hourly_dates"]))
-                step = max(len(climate_data["hourly_dates"]) // num_ticks, 1)
-                x_ticks = range(0, len(climate_data["hourly_dates"]), step)
-                x_labels = [climate_data["hourly_dates"][i] for i in x_ticks]
-                
-                # Plot humidity
-                ax1.set_xlabel('Time', fontsize=12, labelpad=8)
-                ax1.set_ylabel('Humidity (%)', fontsize=12, labelpad=8, color='blue')
-                humidity_line = ax1.plot(climate_data["hourly_dates"], climate_data["hourly_humidity"], 
-                                       color='blue', label='Humidity', linewidth=2)
-                ax1.tick_params(axis='y', labelcolor='blue', labelsize=10)
-                
-                # Plot wind speed on secondary y-axis
-                ax2 = ax1.twinx()
-                ax2.set_ylabel('Wind Speed (m/s)', fontsize=12, labelpad=8, color='green')
-                wind_line = ax2.plot(climate_data["hourly_dates"], climate_data["hourly_wind"], 
-                                    color='green', label='Wind Speed', linewidth=2)
-                ax2.tick_params(axis='y', labelcolor='green', labelsize=10)
-                
-                # Set x-axis ticks med mere plads og mindre tekst
-                plt.xticks(x_ticks, x_labels, rotation=45, ha='right', fontsize=9)
-                
-                # Juster figur størrelse og margins
-                plt.subplots_adjust(bottom=0.3)
-                
-                # Add title
-                ax1.set_title('Humidity and Wind Speed Correlation', fontsize=14, pad=15)
-                
-                # Add legend
-                lines = humidity_line + wind_line
-                labels = ['Humidity', 'Wind Speed']
-                ax1.legend(lines, labels, loc='upper right', fontsize=10)
-                
-                plt.tight_layout()
-                st.pyplot(fig)
+                st.image(_build_humidity_wind_png(hourly_dates, hourly_humidity, hourly_wind),
+                         width="stretch")
         
         # Derefter viser vi statistikken i højre kolonne
         with col2:
             # Tilføj forklarende tekst eller statistik
-            if climate_data.get("hourly_humidity") and len(climate_data["hourly_humidity"]) > 0:
-                avg_humidity = sum(climate_data["hourly_humidity"]) / len(climate_data["hourly_humidity"])
-                max_humidity = max(climate_data["hourly_humidity"])
-                min_humidity = min(climate_data["hourly_humidity"])
+            if len(hourly_humidity) > 0:
+                humidity = np.asarray(hourly_humidity)
+                avg_humidity, min_humidity, max_humidity = humidity.mean(), humidity.min(), humidity.max()
                 
-                avg_wind = sum(climate_data["hourly_wind"]) / len(climate_data["hourly_wind"])
-                max_wind = max(climate_data["hourly_wind"])
-                min_wind = min(climate_data["hourly_wind"])
+                wind = np.asarray(hourly_wind)
+                avg_wind, min_wind, max_wind = wind.mean(), wind.min(), wind.max()
                 
                 st.info(f"""
                 **Humidity & Wind Statistics:**
@@ -270,6 +313,55 @@ def display_climate_data(climate_data, location):
             else:
                 st.info("Detailed humidity and wind statistics not available for this location.")
 
+def display_climate_data(climate_data, location):
+    """Display climate data visualizations."""
+    if "error" in climate_data:
+        st.error(f"Climate data: {climate_data['error']}")
+        return
+    
+    # Prepare data for visualization
+    months = climate_data["months"]
+    temp_data = climate_data["temperature_trends"]
+    precip_data = climate_data["precipitation_trends"]
+    humidity_data = climate_data["humidity_trends"]
+    wind_data = climate_data["wind_trends"]
+    
+    # Plotting libraries are only loaded (and styled) once a page actually draws climate charts
+    _init_style()
+    
+    # Visualizations
+    st.header(f"Climate Trends for {location}")
+    st.subheader("Statistical Data Analysis")
+    
+    # Display additional statistical data if available
+    if "statistics" in climate_data and climate_data["statistics"]:
+        stats = climate_data["statistics"]
+        
+        with st.expander("📊 Detailed Statistical Data (Current Month)", expanded=True):
+            st.markdown(_build_stats_md(location, stats))
+    
+    # Monthly Trends Section
+    st.subheader("Monthly Climate Trends")
+    # convert each series to an array once; plotting, labelling and rescaling all reuse it
+    series = tuple(np.asarray(values, dtype=np.float64)
+                   for values in (temp_data, precip_data, humidity_data, wind_data))
+    
+    # Reuse the figure from the previous rerun when the months are unchanged
+    months_key = tuple(months)
+    cached = st.session_state.get('climate_fig')
+    if cached is not None and cached[0] == months_key:
+        fig = cached[1]
+        _update_monthly_figure(fig, series)
+    else:
+        fig = _build_monthly_figure(months, series)
+        st.session_state['climate_fig'] = (months_key, fig)
+    # the figure stays in session_state for the next rerun, so render it without closing
+    st.image(_render_png(fig), width="stretch")
+
+    # Detailed Forecasts Section
+    st.subheader("Detailed Weather Forecasts")
+    _display_forecasts(climate_data)
+
     # Current Weather Overview
     st.subheader("Current Weather Overview")
     
@@ -298,8 +390,8 @@ def display_climate_data(climate_data, location):
         
         # Add 24h forecasts if available
         if climate_data.get("hourly_temperatures") and len(climate_data["hourly_temperatures"]) >= 8:
-            avg_temp = sum(climate_data["hourly_temperatures"][:8]) / 8
-            avg_humidity = sum(climate_data["hourly_humidity"][:8]) / 8
+            avg_temp = np.mean(climate_data["hourly_temperatures"][:8])
+            avg_humidity = np.mean(climate_data["hourly_humidity"][:8])
             
             with col3:
                 st.metric("🌡️ Avg. Temp (next 24h)", f"{avg_temp:.1f}°C")
@@ -1,11 +1,82 @@
+from functools import lru_cache
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-from utils.constants import (TEMP_HIGH_THRESHOLD, TEMP_LOW_THRESHOLD, 
-                            HUMIDITY_HIGH_THRESHOLD, HUMIDITY_LOW_THRESHOLD, 
-                            WIND_HIGH_THRESHOLD, WIND_LOW_THRESHOLD,
-                            SEVERE_NEGATIVE_IMPACT, NEGATIVE_IMPACT, 
-                            POSITIVE_IMPACT)
+import numpy as np
+from utils.helpers import lazy_import
+from utils.impact_kernel import (classify, advice_keys, GUIDANCE,
+                                 CRITICAL, SUBOPTIMAL, OPTIMAL, NORMAL)
+
+# Sector-specific advice for each deviation from the monthly average
+SECTOR_ADVICE = {
+    "Agriculture": {
+        "high_temp": "Increase irrigation and monitor crop water stress",
+        "low_temp": "Protect sensitive crops from frost damage",
+        "high_humidity": "Increase monitoring for fungal diseases",
+        "low_humidity": "Implement supplementary irrigation",
+        "high_wind": "Protect crops from wind damage",
+        "low_wind": "Optimal conditions for spraying and pollination"
+    },
+    "Energy": {
+        "high_temp": "Optimize cooling systems for power generation",
+        "low_temp": "Protect water-based systems from freezing",
+        "high_humidity": "Monitor insulation and corrosion",
+        "low_humidity": "Optimal solar energy generation conditions",
+        "high_wind": "Maximize wind energy production",
+        "low_wind": "Switch to alternative energy sources"
+    }
+}
+
+# Weather metrics compared against the monthly average, in the kernel's column order
+_CHECKS = ("temperature", "humidity", "wind_speed")
+
+# Guidance for each code in the GUIDANCE column of the impact kernel
+CONTEXT_GUIDANCE = {
+    CRITICAL: "⚠️ Critical weather conditions for {industry} sector. Consider implementing emergency measures.",
+    SUBOPTIMAL: "⚠️ Suboptimal conditions. Follow recommendations above to minimize impact.",
+    OPTIMAL: "✅ Optimal conditions for {industry} activities. Capitalize on favorable weather.",
+    NORMAL: "ℹ️ Normal operating conditions for {industry} sector. Maintain standard procedures."
+}
+
+@lru_cache(maxsize=32)
+def _generic_advice(industry):
+    """Create generic recommendations for sectors without specific advice."""
+    return {
+        "high_temp": f"Adjust cooling systems for {industry} operations",
+        "low_temp": f"Implement cold weather procedures for {industry}",
+        "high_humidity": f"Monitor equipment and materials sensitive to humidity in {industry}",
+        "low_humidity": f"Address dry conditions impact on {industry} operations",
+        "high_wind": f"Secure equipment and materials from wind damage in {industry}",
+        "low_wind": f"Optimal conditions for {industry} outdoor operations"
+    }
+
+def _build_impact_fig(industry, impact_scores, impact_types):
+    """Build the impact score bar chart for a sector and set of scores."""
+    # plotly is only loaded once an impact chart is actually drawn
+    go = lazy_import("plotly.graph_objects")
+    scores = np.asarray(impact_scores)
+    colors = np.where(scores < 0, '#ff9999', '#99ff99')
+    fig = go.Figure(go.Bar(
+        x=list(impact_types),
+        y=scores,
+        marker_color=colors.tolist(),
+        # data labels above positive bars and below negative ones
+        text=[f"{score:.1f}" for score in scores],
+        textposition='outside',
+        textfont_size=12,
+        # scores are clipped to the fixed ±10 axis, so keep labels of full-height bars visible
+        cliponaxis=False
+    ))
+    
+    # Add a horizontal line at y=0
+    fig.add_hline(y=0, line_color='black', opacity=0.3)
+    
+    # Tilføj titel og labels
+    fig.update_layout(
+        title=f'Weather Impact Scores for {industry} Sector',
+        yaxis_title='Impact Score (-10 to +10)',
+        yaxis_range=[-10, 10],
+        font_size=12
+    )
+    return fig
 
 def display_impact_data(impact_data, location, industry):
     """Display impact analysis visualizations."""
@@ -18,14 +89,6 @@ def display_impact_data(impact_data, location, industry):
     # Display impact scores
     impacts = impact_data["impacts"]
     
-    # Create impact visualization
-    impact_types = ["Temperature", "Humidity", "Wind"]
-    impact_scores = [
-        impacts["temperature"]["impact_score"],
-        impacts["humidity"]["impact_score"],
-        impacts["wind"]["impact_score"]
-    ]
-    
     # Display overall impact i en separat boks
     overall = impact_data["overall_impact"]
     st.info(f"""
@@ -40,127 +103,46 @@ def display_impact_data(impact_data, location, industry):
     col1, col2 = st.columns([2, 3])
     
     # Først viser vi impact details i venstre kolonne
-    with col1:
-        st.markdown("### Weather Impact Details")
-        
-        st.markdown("**Temperature Impact:**")
-        st.markdown(f"- Score: {impacts['temperature']['impact_score']:.1f}")
-        st.markdown(f"- {impacts['temperature']['description']}")
-        
-        st.markdown("**Humidity Impact:**")
-        st.markdown(f"- Score: {impacts['humidity']['impact_score']:.1f}")
-        st.markdown(f"- {impacts['humidity']['description']}")
-        
-        st.markdown("**Wind Impact:**")
-        st.markdown(f"- Score: {impacts['wind']['impact_score']:.1f}")
-        st.markdown(f"- {impacts['wind']['description']}")
-        
-        st.markdown("**Current Weather Condition Impact:**")
-        st.markdown(f"- {impact_data['condition_impact']}")
+    t, h, w = impacts["temperature"], impacts["humidity"], impacts["wind"]
+    col1.markdown(f"""### Weather Impact Details
+
+**Temperature Impact:**
+- Score: {t['impact_score']:.1f}
+- {t['description']}
+
+**Humidity Impact:**
+- Score: {h['impact_score']:.1f}
+- {h['description']}
+
+**Wind Impact:**
+- Score: {w['impact_score']:.1f}
+- {w['description']}
+
+**Current Weather Condition Impact:**
+- {impact_data['condition_impact']}
+""")
     
     # Derefter viser vi visualiseringen i højre kolonne
     with col2:
-        # Create impact score visualization
-        fig, ax = plt.subplots(figsize=(8, 5))
-        bars = sns.barplot(x=impact_types, y=impact_scores, 
-                          palette=['#ff9999' if x < 0 else '#99ff99' for x in impact_scores], ax=ax)
-        
-        # Add a horizontal line at y=0
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-        
-        # Add data labels with adjusted positions
-        for i, bar in enumerate(bars.patches):
-            height = bar.get_height()
-            # Juster y-positionen baseret på om værdien er positiv eller negativ
-            if height >= 0:
-                y_pos = height + 0.3
-                va = 'bottom'
-            else:
-                y_pos = height - 0.5
-                va = 'top'
-            
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                y_pos,
-                f'{impact_scores[i]:.1f}',
-                ha='center',
-                va=va,
-                fontsize=12
-            )
-        
-        # Tilføj titel og labels med justeret størrelse og spacing
-        ax.set_title(f'Weather Impact Scores for {industry} Sector', fontsize=14, pad=15)
-        ax.set_ylabel('Impact Score (-10 to +10)', fontsize=12, labelpad=8)
-        ax.set_ylim(-10, 10)
-        
-        # Juster x-akse labels
-        plt.xticks(fontsize=12)
-        ax.tick_params(axis='x', pad=8)
-        plt.yticks(fontsize=12)
-        
-        # Øg padding for at sikre plads til titel og værdier
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Create impact score visualization (rendered client-side by plotly)
+        fig = _build_impact_fig(industry, impact_data["impact_scores"], impact_data["impact_types"])
+        st.plotly_chart(fig, width="stretch")
 
 def get_sector_recommendations(industry, impact_data):
     """Generate sector-specific recommendations based on actual weather impact data."""
     try:
+        current, average = impact_data["current_weather"], impact_data["average_weather"]
+        
         # Verify that we have all required data
-        if not all(key in impact_data["current_weather"] for key in ["temperature", "humidity", "wind_speed"]) or \
-           not all(key in impact_data["average_weather"] for key in ["temperature", "humidity", "wind_speed"]):
+        if not all(key in current and key in average for key in _CHECKS):
             return "Insufficient weather data available for recommendations."
         
-        sector_advice = {
-            "Agriculture": {
-                "high_temp": "Increase irrigation and monitor crop water stress",
-                "low_temp": "Protect sensitive crops from frost damage",
-                "high_humidity": "Increase monitoring for fungal diseases",
-                "low_humidity": "Implement supplementary irrigation",
-                "high_wind": "Protect crops from wind damage",
-                "low_wind": "Optimal conditions for spraying and pollination"
-            },
-            "Energy": {
-                "high_temp": "Optimize cooling systems for power generation",
-                "low_temp": "Protect water-based systems from freezing",
-                "high_humidity": "Monitor insulation and corrosion",
-                "low_humidity": "Optimal solar energy generation conditions",
-                "high_wind": "Maximize wind energy production",
-                "low_wind": "Switch to alternative energy sources"
-            }
-        }
-        
-        # Create generic recommendations for other sectors
-        if industry not in sector_advice:
-            sector_advice[industry] = {
-                "high_temp": f"Adjust cooling systems for {industry} operations",
-                "low_temp": f"Implement cold weather procedures for {industry}",
-                "high_humidity": f"Monitor equipment and materials sensitive to humidity in {industry}",
-                "low_humidity": f"Address dry conditions impact on {industry} operations",
-                "high_wind": f"Secure equipment and materials from wind damage in {industry}",
-                "low_wind": f"Optimal conditions for {industry} outdoor operations"
-            }
-        
-        temp_dev = impact_data["current_weather"]["temperature"] - impact_data["average_weather"]["temperature"]
-        humid_dev = impact_data["current_weather"]["humidity"] - impact_data["average_weather"]["humidity"]
-        wind_dev = impact_data["current_weather"]["wind_speed"] - impact_data["average_weather"]["wind_speed"]
+        temp_dev, humid_dev, wind_dev = (current[key] - average[key] for key in _CHECKS)
         
-        recommendations = []
-        advice = sector_advice[industry]
+        advice = SECTOR_ADVICE.get(industry) or _generic_advice(industry)
         
-        if temp_dev > TEMP_HIGH_THRESHOLD:
-            recommendations.append(advice["high_temp"])
-        elif temp_dev < TEMP_LOW_THRESHOLD:
-            recommendations.append(advice["low_temp"])
-            
-        if humid_dev > HUMIDITY_HIGH_THRESHOLD:
-            recommendations.append(advice["high_humidity"])
-        elif humid_dev < HUMIDITY_LOW_THRESHOLD:
-            recommendations.append(advice["low_humidity"])
-            
-        if wind_dev > WIND_HIGH_THRESHOLD:
-            recommendations.append(advice["high_wind"])
-        elif wind_dev < WIND_LOW_THRESHOLD:
-            recommendations.append(advice["low_wind"])
+        codes = classify(temp_dev, humid_dev, wind_dev)[0]
+        recommendations = [advice[key] for key in advice_keys(codes)]
         
         if not recommendations:
             recommendations.append("Weather conditions are near normal - maintain standard operations.")
@@ -172,11 +154,5 @@ def get_sector_recommendations(industry, impact_data):
 
 def get_context_guidance(industry, temp, wind, impact_score):
     """Provide context-specific guidance based on current conditions."""
-    if impact_score < SEVERE_NEGATIVE_IMPACT:
-        return f"⚠️ Critical weather conditions for {industry} sector. Consider implementing emergency measures."
-    elif impact_score < NEGATIVE_IMPACT:
-        return f"⚠️ Suboptimal conditions. Follow recommendations above to minimize impact."
-    elif impact_score > POSITIVE_IMPACT:
-        return f"✅ Optimal conditions for {industry} activities. Capitalize on favorable weather."
-    else:
-        return f"ℹ️ Normal operating conditions for {industry} sector. Maintain standard procedures."
+    code = classify(0.0, 0.0, 0.0, impact_score)[0, GUIDANCE]
+    return CONTEXT_GUIDANCE[code].format(industry=industry)